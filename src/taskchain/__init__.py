@@ -1,9 +1,9 @@
-from pkg_resources import get_distribution
+from importlib.metadata import version
 
-__version__ = get_distribution('taskchain').version
+__version__ = version('taskchain')
 
 from taskchain.task import Task, ModuleTask, DoubleModuleTask
-from taskchain.data import Data, InMemoryData, JSONData, DirData, FileData, NumpyData, GeneratedData
+from taskchain.data import Data, InMemoryData, JSONData, DirData, FileData, NumpyData, GeneratedData, ParquetData
 from taskchain.config import Config, Context
 from taskchain.chain import Chain, MultiChain
 from taskchain.parameter import Parameter
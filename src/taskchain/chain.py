@@ -1,21 +1,32 @@
 import abc
 import logging
 import re
+import sys
 from collections import defaultdict
 from hashlib import sha256
-from itertools import chain
+from inspect import isclass
 from pathlib import Path
-from typing import Dict, List, Type, Union, Set, Iterable, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Type, Union, Set, Iterable, Sequence, Tuple
 
-import networkx as nx
-import pandas as pd
-
-from taskchain.utils.clazz import get_classes_by_import_string
+from taskchain.utils.clazz import get_classes_by_import_string, module_mtime
+from taskchain.utils.data import LRUCache
 from taskchain.utils.iter import list_or_str_to_list
-from .config import Config
+from .config import Config, _split_use
 from .data import InMemoryData
-from .parameter import AbstractParameter, InputTaskParameter
-from .task import Task, _find_task_full_name, InputTasks
+from .parameter import Parameter, ParameterRegistry
+from .task import (
+    Task,
+    InputTasks,
+    InputTaskReference,
+    _find_task_full_name,
+    _select_task_full_name,
+    _split_task_name,
+    _task_name_aliases,
+)
+
+if TYPE_CHECKING:
+    import networkx as nx
+    import pandas as pd
 
 log_handler = logging.StreamHandler()
 log_handler.setLevel(logging.WARNING)
@@ -27,23 +38,184 @@ class ChainObject:
     object to access whole chain.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def init_chain(self, chain):
         pass
 
 
+class TaskGraph:
+    """
+    Directed graph of tasks with edges from input tasks to tasks which use them.
+
+    Nodes are indexed by integers and edges are stored as adjacency lists of these indices,
+    which is much lighter than general purpose graph. Use `to_networkx` for more advanced graph algorithms.
+    """
+
+    __slots__ = ('nodes', 'index', 'successors', 'predecessors', '_order', '_descendant_masks', '_ancestor_masks')
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        self.nodes: List[Task] = []
+        self.index: Dict[Task, int] = {}
+        self.successors: List[List[int]] = []
+        self.predecessors: List[List[int]] = []
+        # topological order and transitive closure as bitsets (i-th bit for i-th node),
+        # both are computed lazily on first use and dropped when the graph changes
+        self._order: Union[None, List[int]] = None
+        self._descendant_masks: Union[None, List[int]] = None
+        self._ancestor_masks: Union[None, List[int]] = None
+        for task in tasks:
+            self.add_node(task)
+
+    def _invalidate(self):
+        self._order = self._descendant_masks = self._ancestor_masks = None
+
+    def add_node(self, task: Task) -> int:
+        """Add task to graph (if not present yet) and return its index."""
+        if task not in self.index:
+            self.index[task] = len(self.nodes)
+            self.nodes.append(task)
+            self.successors.append([])
+            self.predecessors.append([])
+            self._invalidate()
+        return self.index[task]
+
+    def add_edge(self, task_from: Task, task_to: Task):
+        """Add edge between tasks, tasks are added to graph if needed."""
+        i, j = self.add_node(task_from), self.add_node(task_to)
+        if j not in self.successors[i]:
+            self.successors[i].append(j)
+            self.predecessors[j].append(i)
+            self._invalidate()
+
+    @property
+    def edges(self) -> List[Tuple[Task, Task]]:
+        return [(self.nodes[i], self.nodes[j]) for i, successors in enumerate(self.successors) for j in successors]
+
+    def compute_reachability(self):
+        """
+        Compute descendants and ancestors of all nodes as bitsets,
+        after that reachability queries need no graph walks.
+        It is called automatically by the first reachability query.
+        """
+        order = self.topological_order()
+        self._descendant_masks = self._closure_masks(reversed(order), self.successors)
+        self._ancestor_masks = self._closure_masks(order, self.predecessors)
+
+    def _closure_masks(self, order: Iterable[int], adjacency: List[List[int]]) -> List[int]:
+        # nodes are processed after all their neighbours, so neighbours' masks are complete
+        masks = [0] * len(self.nodes)
+        for i in order:
+            mask = 0
+            for j in adjacency[i]:
+                mask |= masks[j] | (1 << j)
+            masks[i] = mask
+        return masks
+
+    def _nodes_from_mask(self, mask: int) -> Set[Task]:
+        nodes = set()
+        while mask:
+            lowest_bit = mask & -mask
+            nodes.add(self.nodes[lowest_bit.bit_length() - 1])
+            mask ^= lowest_bit
+        return nodes
+
+    @property
+    def descendant_masks(self) -> List[int]:
+        if self._descendant_masks is None:
+            self.compute_reachability()
+        return self._descendant_masks
+
+    @property
+    def ancestor_masks(self) -> List[int]:
+        if self._ancestor_masks is None:
+            self.compute_reachability()
+        return self._ancestor_masks
+
+    def _reachable(self, tasks: Iterable[Task], adjacency: List[List[int]], masks_name: str) -> Set[Task]:
+        indices = [self.index[task] for task in tasks]
+        if not any(adjacency[i] for i in indices):
+            # leaf (or root) nodes, no need to compute bitsets
+            return set()
+        masks = getattr(self, masks_name)
+        mask = 0
+        for i in indices:
+            mask |= masks[i]
+        return self._nodes_from_mask(mask)
+
+    def descendants(self, *tasks: Task) -> Set[Task]:
+        """Get all tasks reachable from any of given tasks."""
+        return self._reachable(tasks, self.successors, 'descendant_masks')
+
+    def ancestors(self, *tasks: Task) -> Set[Task]:
+        """Get all tasks from which any of given tasks is reachable."""
+        return self._reachable(tasks, self.predecessors, 'ancestor_masks')
+
+    def has_path(self, task_from: Task, task_to: Task) -> bool:
+        """Check whether `task_to` is reachable from `task_from`."""
+        start, target = self.index[task_from], self.index[task_to]
+        if start == target:
+            return True
+        if not self.successors[start] or not self.predecessors[target]:
+            return False
+        return bool(self.descendant_masks[start] >> target & 1)
+
+    def topological_order(self) -> List[int]:
+        """
+        Get indices of nodes in topological order (Kahn's algorithm), i.e. each task is after all its input tasks.
+
+        Raises:
+            ValueError: if graph contains cycle
+        """
+        if self._order is not None:
+            return self._order
+        in_degrees = [len(predecessors) for predecessors in self.predecessors]
+        # order itself serves as FIFO queue, nodes are appended once all their predecessors are processed
+        order = [i for i, in_degree in enumerate(in_degrees) if in_degree == 0]
+        for i in order:
+            for j in self.successors[i]:
+                in_degrees[j] -= 1
+                if in_degrees[j] == 0:
+                    order.append(j)
+        if len(order) != len(self.nodes):
+            raise ValueError('Graph is not acyclic')
+        self._order = order
+        return order
+
+    def to_networkx(self) -> 'nx.DiGraph':
+        import networkx as nx
+
+        G = nx.DiGraph()
+        G.add_nodes_from(self.nodes)
+        G.add_edges_from(self.edges)
+        return G
+
+    def __len__(self):
+        return len(self.nodes)
+
+
 class Chain(dict):
     """
     Chain takes a config, recursively load prerequisite configs, initialize tasks connect them to DAG vie input tasks.
     """
 
     log_handler = log_handler
+    # caches hold task classes, so they are bounded not to keep old classes alive (e.g. with autoreload)
+    _task_classes_cache: Dict[Tuple, Tuple[Tuple[Type[Task], ...], Tuple[str, ...], Tuple]] = LRUCache()
+    _dependencies_cache: Dict[Tuple, Dict[str, Tuple[Tuple[str, bool, Any], ...]]] = LRUCache()
 
     @classmethod
     def set_log_level(cls, level):
         """Set log level to log handler responsible for console output of task loggers."""
         Chain.log_handler.setLevel(level)
 
+    @classmethod
+    def clear_caches(cls):
+        """Clear caches of resolved task classes and dependencies shared by all chains."""
+        Chain._task_classes_cache.clear()
+        Chain._dependencies_cache.clear()
+
     def __init__(self, config: Config, shared_tasks: Dict[Tuple[str, str], Task] = None, parameter_mode: bool = True):
         super().__init__()
         self.tasks: Dict[str, Task] = {}
@@ -52,7 +224,10 @@ class Chain(dict):
         self._parameter_mode = parameter_mode
         self._base_config = config
         self._task_registry = shared_tasks if shared_tasks is not None else {}
-        self.graph: Union[None, nx.DiGraph] = None
+        self._task_graph: Union[None, TaskGraph] = None
+        self._graph: Union[None, 'nx.DiGraph'] = None
+        self._topo_order: List[Task] = []
+        self._task_aliases: Union[None, Dict[str, Union[Task, List[str]]]] = None
 
         if not parameter_mode and config.context is not None:
             logging.warning('Using context without parameter mode can break persistence!')
@@ -72,8 +247,10 @@ class Chain(dict):
         return self.tasks_df[['name', 'group', 'namespace', 'computed']].to_markdown()
 
     @property
-    def tasks_df(self) -> pd.DataFrame:
+    def tasks_df(self) -> 'pd.DataFrame':
         """Dataframe with rows ass all tasks in chain."""
+        import pandas as pd
+
         rows = {}
         for name, task in self.tasks.items():
             rows[name] = {
@@ -89,6 +266,13 @@ class Chain(dict):
 
         return pd.DataFrame.from_dict(rows, orient='index').sort_values(['namespace', 'group'], na_position='first')
 
+    @property
+    def graph(self) -> 'nx.DiGraph':
+        """Dependency graph of tasks as networkx DiGraph, it is built on first access."""
+        if self._graph is None:
+            self._graph = self._task_graph.to_networkx()
+        return self._graph
+
     def __getitem__(self, item):
         """Get task by name in dict-like fashion."""
         return self.get(item)
@@ -103,25 +287,50 @@ class Chain(dict):
         """Get task by name."""
         if default is not None:
             raise ValueError('Default task is not allowed')
-        return self.tasks.get(_find_task_full_name(item, self.tasks.keys()))
+        return self._find_task(item)
 
     def __contains__(self, item):
         try:
-            return _find_task_full_name(item, self.tasks.keys()) in self.tasks
+            self._find_task(item)
         except KeyError:
             return False
+        return True
+
+    def _find_task(self, task_name: str) -> Task:
+        """
+        Find task by name in the same way as `_find_task_full_name` of task module.
+        All names of all tasks are resolved only once, so lookup is mostly a single dict access.
+        """
+        if self._task_aliases is None:
+            candidates = defaultdict(list)
+            for fullname in self.tasks:
+                for alias in _task_name_aliases(fullname):
+                    candidates[alias].append(fullname)
+            self._task_aliases = {}
+            for alias, matching_tasks in candidates.items():
+                try:
+                    self._task_aliases[alias] = self.tasks[_select_task_full_name(alias, matching_tasks)]
+                except KeyError:  # ambiguous name, error is raised on lookup
+                    self._task_aliases[alias] = matching_tasks
+        task = self._task_aliases.get(task_name)
+        if task is None:
+            # unusual forms of names are left to general matching
+            return self.tasks[_find_task_full_name(task_name, self.tasks.keys())]
+        if type(task) is list:
+            _select_task_full_name(task_name, task)  # raises KeyError for ambiguous name
+        return task
 
     def _prepare(self):
         """Initialize chain."""
         self._process_config(self._base_config)
-        tasks = self._create_tasks(task_registry={} if self._parameter_mode else self._task_registry)
-        self._process_dependencies(tasks)
-
         if self._parameter_mode:
-            self.tasks = self._recreate_tasks_with_parameter_config(tasks, self._task_registry)
-            self._process_dependencies(self.tasks)
+            # tasks are instantiated only once their parameter configs are known
+            task_specs = self._create_tasks()
+            self._process_dependencies(task_specs)
+            self.tasks = self._recreate_tasks_with_parameter_config(task_specs, self._task_registry)
         else:
-            self.tasks = tasks
+            self.tasks = self._create_tasks(task_registry=self._task_registry)
+        self._process_dependencies(self.tasks)
 
         self._build_graph()
         self._init_objects()
@@ -133,32 +342,21 @@ class Chain(dict):
         self._configs[config.repr_name] = config
         for use in list_or_str_to_list(config.get('uses', [])):
             if isinstance(use, str):
-                pattern = r'(.*) as (.*)'
-                if matched := re.match(pattern, use):
+                filepath, use_namespace = _split_use(use)
+                if use_namespace is not None:
                     # uses config with namespace
-                    used_config = Config(
-                        config.base_dir,
-                        filepath=matched[1],
-                        namespace=f'{config.namespace}::{matched[2]}' if config.namespace else matched[2],
-                        global_vars=config.global_vars,
-                        context=config.context,
-                    )
+                    namespace = f'{config.namespace}::{use_namespace}' if config.namespace else use_namespace
                 else:
                     # uses config without namespace
-                    used_config = Config(
-                        config.base_dir,
-                        use,
-                        namespace=config.namespace if config.namespace else None,
-                        global_vars=config.global_vars,
-                        context=config.context,
-                    )
+                    namespace = config.namespace if config.namespace else None
+                used_config = self._get_used_config(config, filepath, namespace)
             else:
                 # mainly for testing
                 assert isinstance(use, Config)
                 assert config.base_dir == use.base_dir, f'Base dirs of configs `{config}` and `{use}` do not match'
                 if config.namespace:
                     if use.namespace:
-                        use.namespace = f'{config.namespace}::{use.namespace}'
+                        use.namespace = sys.intern(f'{config.namespace}::{use.namespace}')
                     else:
                         use.namespace = config.namespace
                 use.context = config.context
@@ -166,11 +364,27 @@ class Chain(dict):
                 used_config = use
             self._process_config(used_config)
 
-    def _create_tasks(self, task_registry=None) -> Dict[str, Task]:
-        """Look to configs and instantiate their tasks."""
+    def _get_used_config(self, config: Config, filepath: str, namespace: Union[str, None]) -> Config:
+        """
+        Load config used by given config. Each chain has its own config objects, so objects in config data
+        (e.g. ChainObjects) are not shared between chains; parsing of config files is cached anyway.
+        """
+        return Config(
+            config.base_dir,
+            filepath=filepath,
+            namespace=namespace,
+            global_vars=config.global_vars,
+            context=config.context,
+        )
+
+    def _create_tasks(self, task_registry=None) -> Dict[str, Union[Task, 'TaskSpec']]:
+        """
+        Look to configs and instantiate their tasks.
+        In parameter mode, only task specs are created, tasks are instantiated later with parameter configs.
+        """
         tasks = {}
 
-        def _register_task(_task: Task, task_name: str):
+        def _register_task(_task: Union[Task, TaskSpec], task_name: str):
             if task_name in tasks and tasks[task_name].get_config() != _task.get_config():
                 raise ValueError(
                     f'Conflict of task name `{task_name}` '
@@ -179,36 +393,66 @@ class Chain(dict):
             tasks[task_name] = _task
 
         for config in self._configs.values():
-            # first find excluded tasks, then register all other tasks
-            excluded_tasks = set()
-            for field_name, exclude in [('excluded_tasks', True), ('tasks', False)]:
-
-                def _process_task(_task_class):
-                    if exclude:
-                        excluded_tasks.add(_task_class)
-                        return
-                    if _task_class in excluded_tasks:
-                        return
-                    task = self._create_task(_task_class, config, task_registry)
-                    _register_task(task, _task_class.fullname(config))
-
-                for task_description in list_or_str_to_list(config.get(field_name, [])):
-                    if type(task_description) is str:
-                        for task_class in get_classes_by_import_string(task_description, Task):
-                            if task_class.meta.get('abstract', False):
-                                continue
-                            _process_task(task_class)
-                    elif issubclass(task_description, Task):
-                        # mainly for testing
-                        _process_task(task_description)
-                    else:
-                        raise ValueError(f'Unknown task description `{task_description}` in config `{config}`')
+            for task_class in self._get_task_classes(config):
+                if self._parameter_mode:
+                    task = TaskSpec(task_class, config)
+                else:
+                    task = self._create_task(task_class, config, task_registry)
+                _register_task(task, task_class.fullname(config))
         return tasks
 
-    def _recreate_tasks_with_parameter_config(self, tasks: Dict[str, Task], task_registry: Dict) -> Dict[str, Task]:
+    @classmethod
+    def _get_task_classes(cls, config: Config) -> Tuple[Type[Task], ...]:
+        """
+        Get task classes described by config's `tasks` without those in `excluded_tasks`.
+        Result depends only on these two fields and on source of modules with the tasks, so it is memoized
+        and chains built from configs with same task descriptions do not resolve them again
+        until some of the modules changes (e.g. autoreload in jupyter).
+        """
+        task_descriptions = tuple(list_or_str_to_list(config.get('tasks', [])))
+        excluded_descriptions = tuple(list_or_str_to_list(config.get('excluded_tasks', [])))
+        key = task_descriptions, excluded_descriptions
+        try:
+            task_classes, modules, mtimes = cls._task_classes_cache[key]
+            if mtimes == tuple(map(module_mtime, modules)):
+                return task_classes
+        except KeyError:
+            pass
+        except TypeError:  # unhashable description, let resolution raise proper error
+            key = None
+
+        def _resolve(task_description) -> List[Type[Task]]:
+            if type(task_description) is str:
+                return [
+                    task_class
+                    for task_class in get_classes_by_import_string(task_description, Task)
+                    if not task_class.meta.get('abstract', False)
+                ]
+            elif isclass(task_description) and issubclass(task_description, Task):
+                # mainly for testing
+                return [task_description]
+            raise ValueError(f'Unknown task description `{task_description}` in config `{config}`')
+
+        # first find excluded tasks, then register all other tasks
+        excluded_tasks = {task_class for d in excluded_descriptions for task_class in _resolve(d)}
+        task_classes = tuple(
+            task_class for d in task_descriptions for task_class in _resolve(d) if task_class not in excluded_tasks
+        )
+        if key is not None:
+            modules = {d.rsplit('.', 1)[0] for d in task_descriptions + excluded_descriptions if type(d) is str}
+            modules = tuple(modules | {task_class.__module__ for task_class in task_classes})
+            mtimes = tuple(map(module_mtime, modules))
+            # changes of modules without source file (e.g. `__main__` or notebooks) cannot be detected
+            if None not in mtimes:
+                cls._task_classes_cache[key] = task_classes, modules, mtimes
+        return task_classes
+
+    def _recreate_tasks_with_parameter_config(
+        self, tasks: Dict[str, 'TaskSpec'], task_registry: Dict
+    ) -> Dict[str, Task]:
         """
         Helper function for parameter mode.
-        Take tasks and instantiate them again but with TaskParameterConfig
+        Take task specs and instantiate them with TaskParameterConfig
         which contain only parameters needed for the tasks and knows all input tasks (new ones)
         so it can create hash for persistence of task data.
         """
@@ -221,9 +465,9 @@ class Chain(dict):
                     new_tasks[_task_name] = new_tasks[_task.fullname]
                 return new_tasks[_task.fullname]
             # this triggers recursion
-            input_tasks = {n: _get_task(n, t) for n, t in _task.input_tasks.items() if isinstance(t, Task)}
+            input_tasks = {n: _get_task(n, t) for n, t in _task.input_tasks.items() if isinstance(t, TaskSpec)}
             config = TaskParameterConfig(_task, input_tasks)
-            new_task = self._create_task(_task.__class__, config, task_registry)
+            new_task = self._create_task(_task.task_class, config, task_registry)
             new_tasks[_task.fullname] = new_task
             return new_task
 
@@ -254,43 +498,82 @@ class Chain(dict):
 
     @staticmethod
     def _expand_tasks(
-        input_tasks: List[Union[str, Type[Task]]], tasks: Iterable[str], current_task_name: str
-    ) -> List[Union[str, Type[Task]]]:
+        input_tasks: Iterable[InputTaskReference],
+        task_names: Dict[str, Tuple[str, str]],
+        current_task_name: str,
+    ) -> List[InputTaskReference]:
         """
         Expand input tasks definition starting with `~` to all matching tasks.
         If task starts with 2 `~` namespace is ignored, otherwise it must match namespace of current task.
+
+        Args:
+            input_tasks: input tasks of current task
+            task_names: full names of all tasks mapped to their namespace and name without namespace
+            current_task_name: full name of current task
         """
         expanded_tasks = []
-        current_task_namespace = current_task_name.split('::')[:-1]
-        for input_task in input_tasks:
+        current_task_namespace = task_names[current_task_name][0]
+        for reference in input_tasks:
+            input_task = reference.task
             if type(input_task) is not str or not input_task.startswith('~'):
-                expanded_tasks.append(input_task)
+                expanded_tasks.append(reference)
             else:
-                for task_name in tasks:
-                    namespace_check = current_task_namespace == task_name.split('::')[:-1] or input_task.startswith(
-                        '~~'
-                    )
-                    if re.fullmatch(input_task.lstrip('~'), task_name.split('::')[-1]) and namespace_check:
-                        expanded_tasks.append(task_name)
+                ignore_namespace = input_task.startswith('~~')
+                pattern = re.compile(input_task.lstrip('~'))
+                for task_name, (namespace, name) in task_names.items():
+                    if (ignore_namespace or current_task_namespace == namespace) and pattern.fullmatch(name):
+                        expanded_tasks.append(reference._replace(task=task_name))
         return expanded_tasks
 
-    @staticmethod
-    def _process_dependencies(tasks: Dict[str, Task]):
-        """Process input tasks and inject input task object to tasks."""
+    @classmethod
+    def _process_dependencies(cls, tasks: Dict[str, Union[Task, 'TaskSpec']]):
+        """
+        Process input tasks and inject input task object to tasks.
+        Resolution of input task names depends only on task names, classes and namespaces,
+        so it is cached and reused by chains with the same tasks.
+        """
+        key = tuple(
+            (task_name, cls._task_class(task), getattr(task.get_config(), 'namespace', None))
+            for task_name, task in tasks.items()
+        )
+        dependencies = cls._dependencies_cache.get(key)
+        if dependencies is None:
+            dependencies = cls._dependencies_cache[key] = cls._resolve_dependencies(tasks)
+
         for task_name, task in tasks.items():
             input_tasks = InputTasks()
-            for input_task in chain(
-                Chain._expand_tasks(task.meta.get('input_tasks', []), tasks, task_name), task.meta.get('parameters', [])
+            for input_task_name, found, default in dependencies[task_name]:
+                input_tasks[input_task_name] = tasks[input_task_name] if found else default
+            task.set_input_tasks(input_tasks)
+
+    @staticmethod
+    def _task_class(task: Union[Task, 'TaskSpec']) -> Type[Task]:
+        return task.task_class if isinstance(task, TaskSpec) else task.__class__
+
+    @staticmethod
+    def _resolve_dependencies(
+        tasks: Dict[str, Union[Task, 'TaskSpec']]
+    ) -> Dict[str, Tuple[Tuple[str, bool, Any], ...]]:
+        """
+        Find input tasks of all tasks.
+
+        Returns:
+            for each task name tuple of input tasks as (name, whether task was found, default value if not found)
+        """
+        task_names = {task_name: _split_task_name(task_name) for task_name in tasks}
+        # input task names are looked up in index of all names matching tasks in same namespace,
+        # i.e. same as `_find_task_full_name` without determining namespace, but without scanning all tasks
+        name_index = defaultdict(list)
+        for task_name, (namespace, name) in task_names.items():
+            for alias in _task_name_aliases(name):
+                name_index[f'{namespace}::{alias}' if namespace else alias].append(task_name)
+
+        dependencies = {}
+        for task_name, task in tasks.items():
+            input_tasks = {}
+            for input_task, required, default in Chain._expand_tasks(
+                Chain._task_class(task).input_task_references, task_names, task_name
             ):
-                if isinstance(input_task, AbstractParameter):
-                    if not isinstance(input_task, InputTaskParameter):
-                        continue
-                    assert input_task.dont_persist_default_value
-                    assert not input_task.ignore_persistence
-                    required, default = input_task.required, input_task.default
-                    input_task = input_task.task_identifier
-                else:
-                    required, default = True, InputTaskParameter.NO_DEFAULT
                 if type(input_task) is str:
                     input_task_name = input_task
                 else:  # for reference by class
@@ -303,58 +586,64 @@ class Chain(dict):
                     input_task_name = (  # add current config to reference
                         f'{task.get_config().namespace}::{input_task_name}'
                     )
-                if input_task_name in input_tasks.keys():
+                # names are keys of input tasks' dicts as task full names, which are interned too
+                input_task_name = sys.intern(input_task_name)
+                if input_task_name in input_tasks:
                     raise ValueError(f'Multiple input tasks with same name `{input_task_name}`')
                 try:
-                    found_name = _find_task_full_name(input_task_name, tasks, determine_namespace=False)
+                    found_name = _select_task_full_name(input_task_name, name_index.get(input_task_name, []))
                     if type(input_task) is str:
                         input_task_name = found_name
                 except KeyError:
                     if not required:
-                        input_tasks[input_task_name] = default
+                        input_tasks[input_task_name] = input_task_name, False, default
                         continue
                     raise ValueError(f'Input task `{input_task_name}` of task `{task}` not found')
-                input_tasks[input_task_name] = tasks[input_task_name]
-            task.set_input_tasks(input_tasks)
+                input_tasks[input_task_name] = input_task_name, True, None
+            dependencies[task_name] = tuple(input_tasks.values())
+        return dependencies
 
     def _build_graph(self):
-        """Go through task and their input tasks and build nx.DiGraph"""
-        self.graph = G = nx.DiGraph()
-        G.add_nodes_from(self.tasks.values())
+        """Go through task and their input tasks and build TaskGraph"""
+        self._task_graph = G = TaskGraph(self.tasks.values())
 
-        for task in self.tasks.values():
+        for task in G.nodes:
             for input_task in task.input_tasks.values():
                 if not isinstance(input_task, Task):
                     continue
                 G.add_edge(input_task, task)
 
-        if not nx.is_directed_acyclic_graph(G):
+        try:
+            order = G.topological_order()
+        except ValueError:
             raise ValueError('Chain is not acyclic')
+        self._topo_order = [G.nodes[i] for i in order]
 
     def _init_objects(self):
+        """Call `init_chain` of all ChainObjects in configs of the chain, each object is initialized only once."""
+        initialized = set()
         for config in self._configs.values():
             for obj in config.data.values():
-                if isinstance(obj, ChainObject):
+                if isinstance(obj, ChainObject) and id(obj) not in initialized:
+                    initialized.add(id(obj))
                     obj.init_chain(self)
 
     def get_task(self, task: Union[str, Task]) -> Task:
         if isinstance(task, Task):
             return task
-        if task not in self:
+        try:
+            return self._find_task(task)
+        except KeyError:
             raise ValueError(f'Task `{task}` not found')
-        return self.get(task)
 
     def is_task_dependent_on(self, task: Union[str, Task], dependency_task: Union[str, Task]) -> bool:
         """Check whether a task is dependant on dependency task."""
-        task = self.get_task(task)
-        dependency_task = self.get_task(dependency_task)
-
-        return nx.has_path(self.graph, dependency_task, task)
+        return self._task_graph.has_path(self.get_task(dependency_task), self.get_task(task))
 
     def dependent_tasks(self, task: Union[str, Task], include_self: bool = False) -> Set[Task]:
         """Get all tasks which depend ald given task."""
         task = self.get_task(task)
-        descendants = nx.descendants(self.graph, task)
+        descendants = self._task_graph.descendants(task)
         if include_self:
             descendants.add(task)
         return descendants
@@ -362,7 +651,7 @@ class Chain(dict):
     def required_tasks(self, task: Union[str, Task], include_self: bool = False) -> Set[Task]:
         """Get all task which are required fot given task."""
         task = self.get_task(task)
-        ancestors = nx.ancestors(self.graph, task)
+        ancestors = self._task_graph.ancestors(task)
         if include_self:
             ancestors.add(task)
         return ancestors
@@ -378,17 +667,24 @@ class Chain(dict):
             recompute: automatically recompute all forced tasks
             delete_data: also delete persisted data of forced tasks
         """
-        if type(tasks) is str or isinstance(tasks, Task):
-            tasks = [tasks]
-        forced_tasks = set()
-        for task in tasks:
-            forced_tasks |= self.dependent_tasks(task, include_self=True)
-
+        forced_tasks = self._tasks_to_force(tasks)
         for task in forced_tasks:
             task.force(delete_data=delete_data)
 
         if recompute:
-            for task in list(forced_tasks)[::-1]:
+            self._recompute(forced_tasks)
+
+    def _tasks_to_force(self, tasks: Union[str, Task, Iterable[Union[str, Task]]]) -> Set[Task]:
+        """Get given tasks and all tasks dependent on them."""
+        if type(tasks) is str or isinstance(tasks, Task):
+            tasks = [tasks]
+        tasks = {self.get_task(task) for task in tasks}
+        return tasks | self._task_graph.descendants(*tasks)
+
+    def _recompute(self, tasks: Set[Task]):
+        """Compute given tasks in topological order."""
+        for task in self._topo_order:
+            if task in tasks:
                 _ = task.value
 
     @property
@@ -416,7 +712,7 @@ class Chain(dict):
         graph_attr = {'splines': 'ortho'}
         edge_attr = {}
 
-        groups = list({(n.get_config().namespace, n.group) for n in self.graph.nodes})
+        groups = list({(n.get_config().namespace, n.group) for n in self._task_graph.nodes})
         colors = sns.color_palette('pastel', len(groups)).as_hex()
 
         G = gv.Digraph(format='png', engine='dot', graph_attr=graph_attr, node_attr=node_attr, edge_attr=edge_attr)
@@ -427,7 +723,7 @@ class Chain(dict):
             return node.group in groups_to_show
 
         nodes = set()
-        for edge in self.graph.edges:
+        for edge in self._task_graph.edges:
             if _is_node_in_groups(edge[0]) or _is_node_in_groups(edge[1]):
                 nodes.add(edge[0])
                 nodes.add(edge[1])
@@ -457,7 +753,7 @@ class Chain(dict):
                 **attrs,
             )
 
-        for edge in self.graph.edges:
+        for edge in self._task_graph.edges:
             if edge[0] in nodes and edge[1] in nodes:
                 G.edge(_get_slugname(edge[0]), _get_slugname(edge[1]))
         return G
@@ -516,6 +812,49 @@ class Chain(dict):
         return action_name, name, symlink_path
 
 
+class TaskSpec:
+    """
+    Task class together with config which declared it.
+
+    Used in parameter mode instead of task object until dependencies are known
+    and task can be instantiated with its TaskParameterConfig.
+    It provides only attributes needed for resolving input tasks.
+    """
+
+    __slots__ = ('task_class', 'meta', 'fullname', 'parameters', '_config', '_input_tasks')
+
+    def __init__(self, task_class: Type[Task], config: Config):
+        self.task_class = task_class
+        self.meta = task_class.meta
+        self.fullname = task_class.fullname(config)
+        parameters = [p for p in self.meta.get('parameters', None) or [] if isinstance(p, Parameter)]
+        for parameter in parameters:
+            # checked against declaring config, so error does not name the internal parameter config
+            if parameter.required and parameter.name_in_config not in config:
+                raise ValueError(f'Value for parameter `{parameter}` not found in config `{config}`')
+        self.parameters = ParameterRegistry(parameters)
+        self._config = config
+        self._input_tasks: Union[None, InputTasks] = None
+
+    def __str__(self):
+        return self.fullname
+
+    def __repr__(self):
+        return f'<task spec: {self}>'
+
+    def get_config(self) -> Config:
+        return self._config
+
+    @property
+    def input_tasks(self) -> InputTasks:
+        if self._input_tasks is None:
+            raise ValueError(f'Input tasks for task `{self}` not initialized')
+        return self._input_tasks
+
+    def set_input_tasks(self, task_map: InputTasks):
+        self._input_tasks = task_map
+
+
 class TaskParameterConfig(Config):
     """
     Helper config used in parameter mode.
@@ -533,7 +872,7 @@ class TaskParameterConfig(Config):
     and required for correct functionality of TaskChains data persistence.
     """
 
-    def __init__(self, original_task: Task, input_tasks: Dict[str, Task]):
+    def __init__(self, original_task: Union[Task, TaskSpec], input_tasks: Dict[str, Task]):
         super(Config, self).__init__()
 
         self.original_config = original_config = original_task.get_config()
@@ -554,8 +893,15 @@ class TaskParameterConfig(Config):
             for name, task in input_tasks.items()
             if isinstance(task, Task)
         }
+        self._names_for_persistence: Dict[Task, str] = {}
 
     def get_name_for_persistence(self, task: Task) -> str:
+        """Hash of task's parameters and input tasks, these do not change, so it is computed only once."""
+        try:
+            return self._names_for_persistence[task]
+        except KeyError:
+            pass
+
         def _get_input_task_repr(_name, _task):
             if outer_namespace := task.get_config().namespace:
                 # remove namespace of this task from task name
@@ -565,7 +911,9 @@ class TaskParameterConfig(Config):
 
         parameter_repr = task.parameters.repr
         input_tasks_repr = '###'.join(_get_input_task_repr(n, it) for n, it in sorted(self.input_tasks.items()))
-        return sha256(f'{parameter_repr}$$${input_tasks_repr}'.encode()).hexdigest()[:32]
+        name = sha256(f'{parameter_repr}$$${input_tasks_repr}'.encode()).hexdigest()[:32]
+        self._names_for_persistence[task] = name
+        return name
 
     @property
     def repr_name(self) -> str:
@@ -629,10 +977,21 @@ class MultiChain:
             raise ValueError(f'Unknown chain name `{chain_name}`')
         return self.chains[chain_name]
 
-    def force(self, tasks: Union[str, Iterable[Union[str, Task]]], **kwargs):
-        """Pass force to all chains."""
+    def force(self, tasks: Union[str, Iterable[Union[str, Task]]], recompute=False, delete_data=False):
+        """
+        Force given tasks and all dependant tasks in all chains, see `Chain.force`.
+        Tasks shared by multiple chains are forced only once.
+        """
+        forced_tasks = set()
         for chain in self.chains.values():
-            chain.force(tasks, **kwargs)
+            forced_tasks |= chain._tasks_to_force(tasks)
+
+        for task in forced_tasks:
+            task.force(delete_data=delete_data)
+
+        if recompute:
+            for chain in self.chains.values():
+                chain._recompute(forced_tasks)
 
     def latest(self, chain_name: str = None):
         """Get latest chain based on name (alphabetically last)
@@ -2,23 +2,67 @@ from __future__ import annotations
 
 import json
 import logging
-import re
+import os
+import sys
 from collections import defaultdict
 from copy import deepcopy
-from functools import partial
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, Dict, Iterable, Any
+from typing import Union, Dict, Iterable, Any, List, Optional, Tuple
 
 import yaml
 
 from .parameter import ParameterObject
+from .utils import json as fast_json
 from .utils.clazz import find_and_instantiate_clazz, instantiate_clazz
 from .utils.data import search_and_replace_placeholders
+from .utils.io import YAML_LOADER
 from .utils.iter import list_or_str_to_list
 
 LOGGER = logging.getLogger()
 
 
+def _split_use(use: str) -> Tuple[str, Optional[str]]:
+    """
+    Split `uses` entry to filepath and namespace (None if not given).
+
+    >>> _split_use('/path/config.yaml as ns')
+    ('/path/config.yaml', 'ns')
+    >>> _split_use('/path/config.yaml')
+    ('/path/config.yaml', None)
+    """
+    filepath, separator, namespace = use.rpartition(' as ')
+    if not separator:
+        return use, None
+    return filepath, namespace
+
+
+def _load_config_file(filepath: Path) -> Dict:
+    """
+    Load data of json or yaml config file.
+    Parsed content is cached per absolute path as long as the file is not modified,
+    data are copied because configs modify them (context, global vars, objects).
+    """
+    if filepath.suffix not in ('.json', '.yaml'):
+        raise ValueError(f'Unknown file extension for config file `{filepath}`')
+    stat = filepath.stat()
+    return deepcopy(_parse_config_file(os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=256)
+def _parse_config_file(filepath: str, mtime: int, size: int) -> Dict:
+    if filepath.endswith('.json'):
+        with open(filepath, 'rb') as f:
+            content = f.read()
+        try:
+            return fast_json.loads(content)
+        except json.JSONDecodeError:
+            # orjson is stricter, stdlib json accepts also NaN, Infinity or integers bigger than 64 bits
+            return json.loads(content)
+    with open(filepath, 'rb') as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
 class Config(dict):
     """
     Object carrying parameters needed for task execution.
@@ -69,7 +113,7 @@ class Config(dict):
 
         self.base_dir = base_dir
         self._name = None
-        self.namespace = namespace
+        self.namespace = sys.intern(namespace) if namespace is not None else None
         self._data = None
         self.context = Context.prepare_context(context, global_vars=global_vars)
         self.global_vars = global_vars
@@ -81,14 +125,8 @@ class Config(dict):
                 self._filepath, self._part = str(self._filepath).split('#')
             filepath = Path(self._filepath)
             name_parts = filepath.name.split('.')
-            extension = name_parts[-1]
             self._name = '.'.join(name_parts[:-1])
-            if extension == 'json':
-                self._data = json.load(filepath.open())
-            elif extension == 'yaml':
-                self._data = yaml.load(filepath.open(), Loader=yaml.Loader)
-            else:
-                raise ValueError(f'Unknown file extension for config file `{filepath}`')
+            self._data = _load_config_file(filepath)
 
         if data is not None:
             self._data = data
@@ -264,10 +302,24 @@ class Context(Config):
         context_config: Union[None, dict, str, Path, Context, Iterable], namespace=None, global_vars=None
     ) -> Union[Context, None]:
         """Helper function for instantiating Context from various sources"""
-        context = None
         if context_config is None:
             return
-        elif type(context_config) is str or isinstance(context_config, Path):
+        contexts = Context._collect_contexts(context_config, namespace, global_vars)
+        if len(contexts) == 1 and (
+            type(context_config) in (str, dict) or isinstance(context_config, (Path, Context))
+        ):
+            return contexts[0]
+        return Context.merge_contexts(contexts)
+
+    @staticmethod
+    def _collect_contexts(
+        context_config: Union[dict, str, Path, Context, Iterable], namespace=None, global_vars=None
+    ) -> List[Context]:
+        """
+        Instantiate context and contexts it uses (recursively) and return them in order of increasing priority.
+        All contexts are merged only once at the end, not on every level of `uses`.
+        """
+        if type(context_config) is str or isinstance(context_config, Path):
             context = Context(filepath=context_config, namespace=namespace)
         elif type(context_config) is dict:
             value_reprs = [f'{k}:{v}' for k, v in sorted(context_config.items())]
@@ -275,36 +327,35 @@ class Context(Config):
         elif isinstance(context_config, Context):
             context = context_config
         elif isinstance(context_config, Iterable):
-            contexts = map(
-                partial(Context.prepare_context, namespace=namespace, global_vars=global_vars), context_config
-            )
-            context = Context.merge_contexts(contexts)
-
-        if context is None:
+            return [
+                context
+                for item in context_config
+                for context in Context._collect_contexts(item, namespace=namespace, global_vars=global_vars)
+            ]
+        else:
             raise ValueError(f'Unknown context type `{type(context_config)}`')
 
         current_context_data = context.for_namespaces[namespace] if namespace else context
         if 'uses' not in current_context_data:
-            return context
+            return [context]
 
         if global_vars is not None:
             search_and_replace_placeholders(current_context_data['uses'], global_vars)
 
         contexts = [context]
         for use in list_or_str_to_list(current_context_data['uses']):
-            if matched := re.match(r'(.*) as (.*)', use):
+            filepath, use_namespace = _split_use(use)
+            if use_namespace is not None:
                 # uses context with namespace
-                filepath = matched[1]
-                sub_namespace = f'{context.namespace}::{matched[2]}' if context.namespace else matched[2]
+                sub_namespace = f'{context.namespace}::{use_namespace}' if context.namespace else use_namespace
             else:
-                filepath = use
                 sub_namespace = context.namespace if context.namespace else None
-            contexts.append(Context.prepare_context(filepath, sub_namespace, global_vars=global_vars))
+            contexts += Context._collect_contexts(filepath, sub_namespace, global_vars=global_vars)
         if namespace:
             del context.for_namespaces[namespace]['uses']
         else:
             del context._data['uses']
-        return Context.prepare_context(contexts)
+        return contexts
 
     @staticmethod
     def merge_contexts(contexts: Iterable[Context]) -> Context:
@@ -1,28 +1,40 @@
 import abc
 import logging
+import os
 import pickle
 import shutil
+import sys
 from collections.abc import Generator
 from pathlib import Path
-from typing import Any, Dict, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, Type, Union
 
-import h5py
-import numpy as np
-import pandas as pd
-import pylab
 import yaml
-from matplotlib import pyplot as plt
 
 from taskchain.utils import json
-from taskchain.utils.io import iter_json_file, write_jsons
+from taskchain.utils.io import YAML_DUMPER, YAML_LOADER, iter_json_file, write_jsons
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class Data:
+    # types can be given also by full name, e.g. `numpy.ndarray`, so that slow to import libraries
+    # are imported only when needed
     DATA_TYPES = []
 
     @classmethod
     def is_data_type_accepted(cls, data_type):
-        return data_type in cls.DATA_TYPES
+        for accepted_type in cls.DATA_TYPES:
+            if type(accepted_type) is str:
+                # type from module which is not imported yet cannot be used by a task
+                module_name, _, type_name = accepted_type.rpartition('.')
+                module = sys.modules.get(module_name)
+                if module is None:
+                    continue
+                accepted_type = getattr(module, type_name)
+            if data_type == accepted_type:
+                return True
+        return False
 
     def __init__(self):
         self._persisting = False
@@ -91,12 +103,14 @@ class Data:
         return path.parent / f'{path.stem}.run_info.yaml'
 
     def save_run_info(self, info: Dict):
-        yaml.dump(info, self.run_info_path.open('w'))
+        with self.run_info_path.open('w') as f:
+            yaml.dump(info, f, Dumper=YAML_DUMPER)
 
     def load_run_info(self) -> Union[Dict, None]:
         if not self.run_info_path.exists():
             return None
-        return yaml.load(self.run_info_path.open(), yaml.Loader)
+        with self.run_info_path.open('rb') as f:
+            return yaml.load(f, Loader=YAML_LOADER)
 
     @property
     def log_path(self) -> Path:
@@ -175,24 +189,31 @@ class JSONData(FileData):
         return 'json'
 
     def save(self):
-        json.dump(self.value, self.path.open('w'), indent=2, sort_keys=True)
+        # written to temporary file first, so interrupted save never leaves corrupted data
+        tmp_path = self.path.with_name(f'{self.path.name}.tmp')
+        tmp_path.write_bytes(json.dumps(self.value, indent=2, sort_keys=True, as_bytes=True))
+        os.replace(tmp_path, self.path)
 
     def load(self, data_type: Type) -> Any:
-        self._value = json.load(self.path.open())
+        self._value = json.loads(self.path.read_bytes())
         return self._value
 
 
 class NumpyData(FileData):
-    DATA_TYPES = [np.ndarray]
+    DATA_TYPES = ['numpy.ndarray']
 
     @property
     def extension(self) -> Union[str, None]:
         return 'npy'
 
     def save(self):
+        import numpy as np
+
         np.save(str(self.path), self.value)
 
     def load(self, data_type: Type) -> Any:
+        import numpy as np
+
         self._value = np.load(str(self.path))
         return self._value
 
@@ -203,6 +224,8 @@ class ListOfNumpyData(Data):
         return self._base_dir / self._name
 
     def save(self):
+        import numpy as np
+
         if self.path.exists():
             shutil.rmtree(self.path)
         self.path.mkdir()
@@ -211,9 +234,12 @@ class ListOfNumpyData(Data):
             np.save(str(self.path / f'{i}.npy'), v)
 
     def load(self, data_type: Type) -> Any:
-        self._value = []
-        for file in sorted(self.path.glob('*.npy'), key=lambda f: int(f.name.split('.')[0])):
-            self._value.append(np.load(str(file)))
+        import numpy as np
+
+        with os.scandir(self.path) as entries:
+            files = [entry.path for entry in entries if entry.name.endswith('.npy')]
+        files.sort(key=lambda f: int(os.path.basename(f).split('.')[0]))
+        self._value = [np.load(file) for file in files]
         return self._value
 
     def delete(self):
@@ -224,7 +250,7 @@ class ListOfNumpyData(Data):
 
 
 class PandasData(FileData):
-    DATA_TYPES = [pd.DataFrame, pd.Series]
+    DATA_TYPES = ['pandas.DataFrame', 'pandas.Series']
 
     @property
     def extension(self) -> Union[str, None]:
@@ -234,12 +260,42 @@ class PandasData(FileData):
         self.value.to_pickle(self.path)
 
     def load(self, data_type: Type) -> Any:
+        import pandas as pd
+
         self._value = pd.read_pickle(self.path)
         return self._value
 
 
+class ParquetData(FileData):
+    """
+    Dataframe persisted in parquet format, which is smaller and faster to load than pickle used by PandasData.
+    It is not chosen automatically (requires pyarrow or fastparquet), task has to return it explicitly.
+    """
+
+    def __init__(self, compression: Union[str, None] = 'zstd'):
+        """
+        Args:
+            compression: parquet compression codec, e.g. `snappy` or None, zstd gives small files and fast loading
+        """
+        super().__init__()
+        self.compression = compression
+
+    @property
+    def extension(self) -> Union[str, None]:
+        return 'parquet'
+
+    def save(self):
+        self.value.to_parquet(self.path, compression=self.compression)
+
+    def load(self, data_type: Type) -> Any:
+        import pandas as pd
+
+        self._value = pd.read_parquet(self.path)
+        return self._value
+
+
 class FigureData(FileData):
-    DATA_TYPES = [pylab.Figure]
+    DATA_TYPES = ['matplotlib.figure.Figure']
 
     @property
     def extension(self) -> Union[str, None]:
@@ -249,6 +305,8 @@ class FigureData(FileData):
         pickle.dump(self.value, self.path.open('wb'))
         self.value.savefig(self._base_dir / f'{self._name}.png')
         self.value.savefig(self._base_dir / f'{self._name}.svg')
+        from matplotlib import pyplot as plt
+
         plt.close(self.value)
 
     def load(self, data_type: Type) -> Any:
@@ -372,8 +430,7 @@ class ContinuesData(Data):
 
     def init_persistence(self, base_dir: Path, name: str):
         super().init_persistence(base_dir, name)
-        if not self.tmp_path.exists():
-            self.tmp_path.mkdir()
+        self.tmp_path.mkdir(exist_ok=True)
         self._dir = self.tmp_path
 
     @property
@@ -409,12 +466,14 @@ class ContinuesData(Data):
 
 
 class H5Data(ContinuesData):
-    def append_data(self, dataset, data: np.ndarray, dataset_len=None):
+    def append_data(self, dataset, data: 'np.ndarray', dataset_len=None):
         len_before = dataset.len() if dataset_len is None else dataset_len
         dataset.resize(len_before + data.shape[0], axis=0)
         dataset[len_before:] = data
 
     def data_file(self, mode=None):
+        import h5py
+
         return h5py.File(self.dir / 'data.h5', 'a' if mode is None else 'r')
 
     def dataset(self, name, data_file=None, maxshape=None, dtype=None):
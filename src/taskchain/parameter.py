@@ -177,6 +177,8 @@ class ParameterRegistry:
             if parameter.name in self._parameters:
                 raise ValueError(f'Multiple parameters with same name `{parameter.name}`')
             self._parameters[parameter.name] = parameter
+        # repr has to be independent of order of parameters in Meta, parameters are sorted only once
+        self._sorted_parameters = tuple(self._parameters[name] for name in sorted(self._parameters))
 
     def set_values(self, config):
         for parameter in self._parameters.values():
@@ -216,7 +218,7 @@ class ParameterRegistry:
     @property
     def repr(self):
         reprs = []
-        for name, parameter in sorted(self._parameters.items()):
+        for parameter in self._sorted_parameters:
             repr = parameter.repr
             if repr is not None:
                 reprs.append(repr)
@@ -230,6 +232,8 @@ class ParameterObject(abc.ABC):
     Every class used in configs has to be inherit from this class.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def repr(self) -> str:
         """
@@ -1,26 +1,40 @@
 import abc
+import functools
 import getpass
 import inspect
 import logging
 import re
+import sys
+import time
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime
 from inspect import isclass
+from itertools import chain
 from pathlib import Path
-from typing import Union, Any, get_type_hints, Type, Dict, Iterable, get_origin, List
+from typing import Union, Any, get_type_hints, Type, Dict, Iterable, get_origin, List, NamedTuple, Tuple
 
 import taskchain
 from taskchain.utils.clazz import Meta, inheritors, isinstance as custom_isinstance, fullname
 from .config import Config
 from .data import Data, DirData, InMemoryData
-from .parameter import Parameter, ParameterRegistry, NO_VALUE
+from .parameter import (
+    AbstractParameter,
+    InputTaskParameter,
+    Parameter,
+    ParameterRegistry,
+    NO_DEFAULT,
+    NO_VALUE,
+)
 
 
 class MetaTask(type):
     @property
     def meta(cls):
-        return Meta(cls)
+        """Attributes of task's Meta class, they are collected once per class."""
+        if '_meta' not in cls.__dict__:
+            cls._meta = Meta(cls)
+        return cls._meta
 
     @property
     def group(cls) -> str:
@@ -28,23 +42,65 @@ class MetaTask(type):
 
     @property
     def slugname(cls) -> str:
-        if 'name' in cls.meta:
-            name = cls.meta.name
-        else:
-            name = re.sub(r'(?<!^)(?=[A-Z])', '_', cls.__name__).lower()
-            if name.endswith('_task'):
-                name = name[:-5]
-        if cls.group:
-            return f'{cls.group}:{name}'
-        return name
+        """Name derived from class name (or Meta) and group, it depends only on the class, so it is computed once."""
+        if '_slugname' not in cls.__dict__:
+            meta = cls.meta
+            if 'name' in meta:
+                name = meta.name
+            else:
+                name = re.sub(r'(?<!^)(?=[A-Z])', '_', cls.__name__).lower()
+                if name.endswith('_task'):
+                    name = name[:-5]
+            group = cls.group
+            cls._slugname = sys.intern(f'{group}:{name}' if group else name)
+        return cls._slugname
+
+    @property
+    def input_task_references(cls) -> Tuple['InputTaskReference', ...]:
+        """
+        Input tasks declared in Meta, i.e. `input_tasks` and InputTaskParameters in `parameters`.
+        They depend only on the class, so they are collected once per class.
+        """
+        if '_input_task_references' not in cls.__dict__:
+            references = []
+            for input_task in chain(cls.meta.get('input_tasks', []), cls.meta.get('parameters', [])):
+                if isinstance(input_task, AbstractParameter):
+                    if not isinstance(input_task, InputTaskParameter):
+                        continue
+                    assert input_task.dont_persist_default_value
+                    assert not input_task.ignore_persistence
+                    references.append(
+                        InputTaskReference(input_task.task_identifier, input_task.required, input_task.default)
+                    )
+                else:
+                    references.append(InputTaskReference(input_task))
+            cls._input_task_references = tuple(references)
+        return cls._input_task_references
+
+    @property
+    def run_argument_names(cls) -> Tuple[str, ...]:
+        """Names of arguments of `run` method (without self), they are inspected once per class."""
+        if '_run_argument_names' not in cls.__dict__:
+            parameters = list(inspect.signature(cls.run).parameters.values())[1:]
+            if any(parameter.default != inspect.Parameter.empty for parameter in parameters):
+                raise AttributeError('Kwargs arguments in run method not allowed')
+            cls._run_argument_names = tuple(parameter.name for parameter in parameters)
+        return cls._run_argument_names
 
     def fullname(cls, config) -> str:
+        # full names are used as keys in chain's and input tasks' dicts, interning makes lookups by them cheaper
         if config is None or config.namespace is None:
             return cls.slugname
-        return f'{config.namespace}::{cls.slugname}'
+        return sys.intern(f'{config.namespace}::{cls.slugname}')
 
     @property
     def data_type(cls) -> Type[Union[Data, Any]]:
+        """Type of task's result given by return annotation of `run` or Meta, it is resolved once per class."""
+        if '_data_type' not in cls.__dict__:
+            cls._data_type = cls._resolve_data_type()
+        return cls._data_type
+
+    def _resolve_data_type(cls) -> Type[Union[Data, Any]]:
         return_data_type = get_type_hints(cls.run).get('return')
         meta_data_type = cls.meta.get('data_type')
 
@@ -66,7 +122,13 @@ class MetaTask(type):
         return get_origin(data_type) if get_origin(data_type) else data_type
 
     @property
-    def data_class(self) -> Type[Data]:
+    def data_class(cls) -> Type[Data]:
+        """Data class handling persistence of task's result, it is resolved once per class."""
+        if '_data_class' not in cls.__dict__:
+            cls._data_class = cls._resolve_data_class()
+        return cls._data_class
+
+    def _resolve_data_class(self) -> Type[Data]:
         if 'data_class' in self.meta:
             return self.meta['data_class']
 
@@ -123,7 +185,9 @@ class Task(object, metaclass=MetaTask):
         self.data_type = self.__class__.data_type
 
         self.logger = logging.getLogger(f'task_{self.fullname}')
-        self.logger.setLevel(logging.DEBUG)
+        if self.logger.level != logging.DEBUG:
+            # setting level clears caches of all loggers, which is slow when there are many tasks
+            self.logger.setLevel(logging.DEBUG)
 
         self._prepare_parameters()
 
@@ -190,10 +254,7 @@ class Task(object, metaclass=MetaTask):
         It looks to task's parameters and input tasks.
         """
         args = []
-        for arg, parameter in inspect.signature(self.run).parameters.items():
-            if parameter.default != inspect.Parameter.empty:
-                raise AttributeError('Kwargs arguments in run method not allowed')
-
+        for arg in self.__class__.run_argument_names:
             input_tasks_arg = self.input_tasks[arg] if arg in self.input_tasks else NO_VALUE
             if isinstance(input_tasks_arg, Task):
                 input_tasks_arg = input_tasks_arg.value
@@ -398,7 +459,9 @@ class Task(object, metaclass=MetaTask):
 
             if isinstance(self._config, TaskParameterConfig):
                 self._run_info['input_tasks'] = self._config.input_tasks
-        self._run_info['started'] = datetime.timestamp(datetime.now())
+        self._run_info['started'] = str(datetime.now())
+        # monotonic clock for duration, wall-clock time is needed only for human-readable timestamps
+        self._run_started = time.perf_counter()
 
     def save_to_run_info(self, record):
         """
@@ -412,10 +475,8 @@ class Task(object, metaclass=MetaTask):
         self._run_info['log'].append(record)
 
     def _finish_run_info(self):
-        now = datetime.now()
-        self._run_info['ended'] = str(now)
-        self._run_info['time'] = datetime.timestamp(now) - self._run_info['started']
-        self._run_info['started'] = str(datetime.fromtimestamp(self._run_info['started']))
+        self._run_info['time'] = time.perf_counter() - self._run_started
+        self._run_info['ended'] = str(datetime.now())
 
         if self._data and self._data.is_logging:
             self._data.save_run_info(self._run_info)
@@ -442,6 +503,14 @@ class DoubleModuleTask(Task, metaclass=MetaDoubleModuleTask):
     """
 
 
+class InputTaskReference(NamedTuple):
+    """Input task as declared in task's Meta, by name or by class."""
+
+    task: Union[str, Type['Task']]
+    required: bool = True
+    default: Any = NO_DEFAULT
+
+
 class InputTasks(dict):
     """
     Registry of input tasks.
@@ -482,12 +551,10 @@ class InputTasks(dict):
 def _find_task_full_name(task_name: str, tasks: Iterable[str], determine_namespace: bool = True) -> str:
     def _task_name_match(name, fullname):
         # remove and check namespaces
-        namespace = '::'.join(name.split('::')[:-1])
-        fullnamespace = '::'.join(fullname.split('::')[:-1])
+        namespace, name = _split_task_name(name)
+        fullnamespace, fullname = _split_task_name(fullname)
         if (namespace or not determine_namespace) and fullnamespace != namespace:
             return False
-        name = name.split('::')[-1]
-        fullname = fullname.split('::')[-1]
 
         # direct check
         if fullname == name:
@@ -500,6 +567,10 @@ def _find_task_full_name(task_name: str, tasks: Iterable[str], determine_namespa
         return False
 
     matching_tasks = [t for t in tasks if _task_name_match(task_name, t)]
+    return _select_task_full_name(task_name, matching_tasks)
+
+
+def _select_task_full_name(task_name: str, matching_tasks: List[str]) -> str:
     if len(matching_tasks) > 1:
         # if any task name is suffix of all others, it has priority
         for cand in matching_tasks:
@@ -510,3 +581,32 @@ def _find_task_full_name(task_name: str, tasks: Iterable[str], determine_namespa
     if len(matching_tasks) == 0:
         raise KeyError(f'Task `{task_name}` not found')
     return matching_tasks[0]
+
+
+def _task_name_aliases(fullname: str) -> List[str]:
+    """
+    All names under which `_find_task_full_name` can find task with given full name.
+
+    >>> _task_name_aliases('ns::g:name')
+    ['g:name', 'name', 'ns::g:name', 'ns::name']
+    """
+    namespace, name = _split_task_name(fullname)
+    names = [name, name.split(':')[-1]] if ':' in name else [name]
+    if not namespace:
+        return names
+    return names + [f'{namespace}::{n}' for n in names]
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_task_name(name: str) -> Tuple[str, str]:
+    """
+    Split task name to namespace (empty if there is none) and name without namespace.
+    Same names are split repeatedly when input tasks are resolved, so results are cached.
+
+    >>> _split_task_name('ns2::ns1::g:a')
+    ('ns2::ns1', 'g:a')
+    >>> _split_task_name('a')
+    ('', 'a')
+    """
+    *namespace, name = name.split('::')
+    return '::'.join(namespace), name
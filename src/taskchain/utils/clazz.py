@@ -1,12 +1,17 @@
+import builtins
 import functools
 import importlib
 import inspect
+import os
 import re
+import sys
 from copy import deepcopy
 from pathlib import Path
 from time import sleep
 from types import ModuleType
-from typing import List, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from taskchain.utils.data import LRUCache
 
 
 class Meta(dict):
@@ -37,12 +42,14 @@ class persistent:
 
     def __init__(self, method):
         self.method = method
+        self.attr = f'__{method.__name__}'
 
     def __call__(self, obj):
-        attr = f'__{self.method.__name__}'
-        if not hasattr(obj, attr) or getattr(obj, attr) is None:
-            setattr(obj, attr, self.method(obj))
-        return getattr(obj, attr)
+        value = getattr(obj, self.attr, None)
+        if value is None:
+            value = self.method(obj)
+            setattr(obj, self.attr, value)
+        return value
 
     def __get__(self, instance, instancetype):
         return functools.partial(self.__call__, instance)
@@ -74,7 +81,8 @@ class repeat_on_error:
                 except Exception as error:
                     if i + 1 == self.retries:
                         raise error
-                    sleep(waiting_time)
+                    if waiting_time > 0:
+                        sleep(waiting_time)
                     waiting_time *= self.wait_extension
             assert False
 
@@ -149,27 +157,78 @@ def import_by_string(string: str) -> Union[ModuleType, List[type], type]:
     String can contain `*` as last part then list of all members in the module is return.
     """
     parts = string.split('.')
-    try:
-        return importlib.import_module('.'.join(parts))
-    except ModuleNotFoundError:
-        pass
-
     has_wiled_card = '*' in parts[-1]
-    module = importlib.import_module('.'.join(parts[:-1]))
+    if not has_wiled_card:
+        module = sys.modules.get(string)
+        if module is not None:
+            return module
+        # member of already imported module is taken directly, failed import of nonexistent module is slow
+        module = sys.modules.get('.'.join(parts[:-1]))
+        if module is not None and not parts[-1].startswith('__') and parts[-1] in module.__dict__:
+            return module.__dict__[parts[-1]]
+        # module names cannot contain wildcard, so there is no need to try to import such module
+        try:
+            return _import_module(string)
+        except ModuleNotFoundError:
+            pass
+
+    module_name = '.'.join(parts[:-1])
     pattern = re.compile(re.sub(r'((?<=([^.]))|^)\*', '.*', parts[-1]))
 
-    members = []
-    for name, member in module.__dict__.items():
-        if pattern.match(name) and not name.startswith('__'):
-            if not has_wiled_card:
+    if has_wiled_card:
+        members = [member for name, member in _module_own_members(module_name) if pattern.match(name)]
+    else:
+        module = _import_module(module_name)
+        for name, member in module.__dict__.items():
+            if pattern.match(name) and not name.startswith('__'):
                 return member
-            if inspect.getmodule(member) == module:
-                members.append(member)
+        members = []
     if len(members) == 0:
         raise ImportError(f'Cannot import "{string}".')
     return members
 
 
+def _import_module(module_name: str) -> ModuleType:
+    """Import module, already imported modules are taken directly from `sys.modules` without import machinery."""
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return module
+
+
+# modules' specs identify their (re)loads, cache is bounded not to keep members of old modules alive
+_module_members_cache: Dict[str, Tuple[Any, int, Tuple[Tuple[str, Any], ...]]] = LRUCache()
+
+
+def _module_own_members(module_name: str) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Get names and members defined directly in the module (not imported into it), used for wildcard imports.
+    Members are cached until the module is reloaded or its source file changes (e.g. autoreload in jupyter),
+    members of modules without source file (e.g. `__main__`) are not cached, their changes cannot be detected.
+    """
+    module = _import_module(module_name)
+    spec, mtime = getattr(module, '__spec__', None), module_mtime(module_name)
+    cached = _module_members_cache.get(module_name)
+    if cached is not None and cached[0] is spec and cached[1] == mtime:
+        return cached[2]
+    members = tuple(
+        (name, member)
+        for name, member in module.__dict__.items()
+        if not name.startswith('__') and inspect.getmodule(member) == module
+    )
+    if spec is not None and mtime is not None:
+        _module_members_cache[module_name] = spec, mtime, members
+    return members
+
+
+def module_mtime(module_name: str) -> Optional[int]:
+    """Get modification time of source file of imported module, None if module is not imported or has no file."""
+    try:
+        return os.stat(sys.modules[module_name].__file__).st_mtime_ns
+    except (KeyError, AttributeError, TypeError, OSError):
+        return None
+
+
 def get_classes_by_import_string(string: str, cls: Type[object] = object):
     """
     Get all classes inheriting given class and are described by given import string.
@@ -220,11 +279,11 @@ def find_and_instantiate_clazz(obj, instancelize_clazz_fce=None):
     Got through json-like object and find all classes definitions and instantiate them.
     Class definition is dict with `class` key and optionally `args` and `kwargs` keys.
     """
-    definition = deepcopy(obj)
-
     if instancelize_clazz_fce is None:
         instancelize_clazz_fce = instantiate_clazz
-    if isinstance(obj, dict) and 'class' in obj:
+    # builtin isinstance is enough for builtin types and much faster than autoreload-safe one
+    if builtins.isinstance(obj, dict) and 'class' in obj:
+        definition = deepcopy(obj)
         instance = instancelize_clazz_fce(
             obj['class'],
             find_and_instantiate_clazz(obj.get('args', [])),
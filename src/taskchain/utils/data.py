@@ -1,18 +1,28 @@
 import re
-from copy import deepcopy
+from collections import OrderedDict
 from typing import Any, Callable, Generator, Iterable, Type
 
+_SEQUENCE_TYPES = frozenset((list, tuple, set))
+_PLACEHOLDER_PATTERN = re.compile(r'{(.*?)}')
+
 
 def traverse(obj: Any) -> Generator:
-    """Recursively traverse json-like objects and yield all primitive values."""
-    if type(obj) in [list, tuple, set]:
-        for v in obj:
-            yield from traverse(v)
-    elif isinstance(obj, dict):
-        for v in obj.values():
-            yield from traverse(v)
-    else:
-        yield obj
+    """Traverse json-like objects and yield all primitive values."""
+    # explicit stack instead of recursive generators, which pay for a frame per nested container
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        o = pop()
+        if type(o) is set:
+            # sets have no order to preserve, so they are pushed as they are
+            extend(o)
+        elif type(o) in _SEQUENCE_TYPES:
+            # reversed so values are yielded in original order
+            extend(reversed(o))
+        elif isinstance(o, dict):
+            extend(reversed(o.values()))
+        else:
+            yield o
 
 
 def search_and_apply(obj: Any, fce: Callable, allowed_types: Iterable[Type] = None, filter: Callable = None):
@@ -24,16 +34,18 @@ def search_and_apply(obj: Any, fce: Callable, allowed_types: Iterable[Type] = No
         allowed_types: types for which fce should by applied
         filter: filter function which determines if fce should be applied
     """
+    if allowed_types is not None:
+        allowed_types = tuple(allowed_types)
 
     def _is_valid(v):
-        if allowed_types is not None and not any(isinstance(v, t) for t in allowed_types):
+        if allowed_types is not None and not isinstance(v, allowed_types):
             return False
         if filter is not None and not filter(v):
             return False
         return True
 
     def _traverse(o):
-        if type(o) in [list, tuple, set]:
+        if type(o) in _SEQUENCE_TYPES:
             for i, v in enumerate(o):
                 if not _traverse(v) and _is_valid(v):
                     o[i] = fce(v)
@@ -76,7 +88,9 @@ def search_and_replace_placeholders(obj, replacements):
     def _apply(string):
         if isinstance(string, ReprStr):
             return string
-        new_string, replacement_count = re.subn(r'{(.*?)}', _replace, string)
+        if '{' not in string:
+            return string
+        new_string, replacement_count = _PLACEHOLDER_PATTERN.subn(_replace, string)
         if replacement_count:
             return ReprStr(new_string, string)
         return string
@@ -87,9 +101,36 @@ def search_and_replace_placeholders(obj, replacements):
     return obj
 
 
+class LRUCache(OrderedDict):
+    """Dict which keeps only `maxsize` most recently used items."""
+
+    def __init__(self, maxsize: int = 256):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 class ReprStr(str):
     """String which carry additional string which is used as `__repr__`."""
 
+    __slots__ = ('repr',)
+
     def __new__(cls, value, repr_: str):
         s = str.__new__(cls, value)
         s.repr = repr(repr_)
@@ -99,7 +140,10 @@ class ReprStr(str):
         return self.repr
 
     def __copy__(self):
-        return ReprStr(str(self), self.repr)
+        # repr is already computed, so it is set directly instead of passing it through `__new__` again
+        s = str.__new__(self.__class__, self)
+        s.repr = self.repr
+        return s
 
     def __deepcopy__(self, memo):
-        return ReprStr(str(self), deepcopy(self.repr))
+        return self.__copy__()
@@ -3,11 +3,15 @@ import logging
 from pathlib import Path
 from typing import Union
 
-import numpy as np
+import yaml
 
 from taskchain.utils import json
 from taskchain.utils.iter import progress_bar
 
+# libyaml based loader and dumper are much faster, they handle same documents as the pure python ones
+YAML_LOADER = getattr(yaml, 'CLoader', yaml.Loader)
+YAML_DUMPER = getattr(yaml, 'CDumper', yaml.Dumper)
+
 
 def write_jsons(jsons, filename, use_tqdm=True, overwrite=True, nan_to_null=True, **kwargs):
     """
@@ -57,6 +61,8 @@ class NumpyEncoder(orig_json.JSONEncoder):
         self.ignore_nan = ignore_nan
 
     def default(self, obj):
+        import numpy as np
+
         if isinstance(obj, np.ndarray):
             return self.default(obj.tolist())
         if isinstance(obj, list):
@@ -1,11 +1,14 @@
 import json
 import logging
+import sys
+import types
 from typing import List
 
+import networkx as nx
 import pytest
 
 from taskchain import Chain, Config, Context, InMemoryData, MultiChain, Task
-from taskchain.chain import ChainObject
+from taskchain.chain import ChainObject, TaskGraph
 from taskchain.parameter import Parameter, ParameterObject
 from tests.tasks.a import ATask
 
@@ -52,6 +55,72 @@ def test_task_exclusion(tmp_path):
     assert len(chain.tasks) == 1
 
 
+def test_task_classes_are_resolved_once(tmp_path):
+    config_data = {
+        'tasks': ['tests.tasks.a.*'],
+        'excluded_tasks': ['tests.tasks.a.B'],
+    }
+    chain = Chain(Config(tmp_path, name='config', data=config_data))
+    chain2 = Chain(Config(tmp_path, name='config2', data=config_data))
+
+    assert chain._get_task_classes(chain._base_config) is chain2._get_task_classes(chain2._base_config)
+    assert chain.tasks['a'] is not chain2.tasks['a']
+
+
+def test_task_classes_from_module_without_file(tmp_path, monkeypatch):
+    module = types.ModuleType('fileless_tasks')
+    monkeypatch.setitem(sys.modules, 'fileless_tasks', module)
+    config = Config(tmp_path, name='config', data={'tasks': ['fileless_tasks.FilelessTask']})
+
+    for value in range(2):
+        # redefinition of task as in notebook, module has no file to detect the change
+        source = f'class FilelessTask(Task):\n    def run(self) -> int:\n        return {value}'
+        exec(source, {'Task': Task}, module.__dict__)
+        module.FilelessTask.__module__ = 'fileless_tasks'
+        assert Chain._get_task_classes(config) == (module.FilelessTask,)
+
+
+def test_dependencies_are_resolved_once(tmp_path):
+    config_data = {'tasks': ['tests.tasks.c.*']}
+    chain = Chain(Config(tmp_path, name='config', data=config_data), parameter_mode=False)
+    cache_size = len(Chain._dependencies_cache)
+    chain2 = Chain(Config(tmp_path, name='config', data=config_data), parameter_mode=False)
+
+    assert len(Chain._dependencies_cache) == cache_size
+    assert chain2.tasks['o'].input_tasks['m'] is chain2.tasks['m']
+    assert chain2.tasks['o'].input_tasks['m'] is not chain.tasks['m']
+
+
+def test_chain_caches_are_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(Chain._dependencies_cache, 'maxsize', 2)
+    for i in range(3):
+        config = Config(tmp_path, name='config', namespace=f'ns{i}', data={'tasks': ['tests.tasks.c.*']})
+        Chain(config, parameter_mode=False)
+    assert len(Chain._dependencies_cache) == 2
+
+    Chain.clear_caches()
+    assert len(Chain._dependencies_cache) == len(Chain._task_classes_cache) == 0
+
+
+class CountedTask(Task):
+    instances = 0
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        CountedTask.instances += 1
+
+    def run(self) -> bool:
+        return False
+
+
+def test_tasks_are_instantiated_once_in_parameter_mode(tmp_path):
+    CountedTask.instances = 0
+    chain = Chain(Config(tmp_path, name='config', data={'tasks': [CountedTask]}))
+
+    assert CountedTask.instances == 1
+    assert isinstance(chain.counted, CountedTask)
+
+
 def test_task_creation_with_uses(tmp_path):
     config_data = {
         'uses': [
@@ -174,6 +243,41 @@ def test_dependency_graph(tmp_path):
     assert len(chain.graph.nodes) == 3
     assert len(chain.graph.edges) == 2
 
+    assert isinstance(chain.graph, nx.DiGraph)
+    assert chain.graph is chain.graph
+    assert set(chain.graph.edges) == set(chain._task_graph.edges)
+
+    graph = chain._task_graph
+    order = graph.topological_order()
+    for task_from, task_to in graph.edges:
+        assert order.index(graph.index[task_from]) < order.index(graph.index[task_to])
+
+
+def test_reachability_bitsets(tmp_path):
+    chain = Chain(Config(tmp_path, name='config', data={'tasks': ['tests.tasks.c.*']}))
+    graph = TaskGraph(chain._task_graph.nodes)
+    for task_from, task_to in chain._task_graph.edges:
+        graph.add_edge(task_from, task_to)
+    assert graph._descendant_masks is None
+
+    # queries on leaves need no bitsets
+    assert graph.descendants(chain['p']) == graph.ancestors(chain['m']) == set()
+    assert not graph.has_path(chain['x'], chain['p'])
+    assert graph._descendant_masks is None
+
+    G = graph.to_networkx()
+    for task in chain.tasks.values():
+        assert graph.descendants(task) == nx.descendants(G, task)
+        assert graph.ancestors(task) == nx.ancestors(G, task)
+        for other in chain.tasks.values():
+            assert graph.has_path(task, other) == (task == other or nx.has_path(G, task, other))
+    assert graph._descendant_masks is not None
+
+    # bitsets are recomputed after graph changes
+    graph.add_edge(chain['x'], chain['m'])
+    assert graph._descendant_masks is None
+    assert chain['p'] in graph.descendants(chain['x'])
+
 
 def test_dependency(tmp_path):
     config_data = {
@@ -193,6 +297,7 @@ def test_dependency(tmp_path):
     assert not chain.is_task_dependent_on('x', 'o')
 
     assert chain.is_task_dependent_on(chain.tasks['p'], chain.tasks['o'])
+    assert chain.is_task_dependent_on('p', 'p')
 
     assert len(chain.dependent_tasks('x')) == 0
     assert len(chain.dependent_tasks('x', True)) == 1
@@ -230,6 +335,10 @@ def test_forcing(tmp_path):
     assert chain.tasks['p'].has_data
     assert not chain.tasks['n'].is_forced
 
+    assert chain._task_graph.descendants(chain.tasks['m'], chain.tasks['n']) == {chain.tasks['o'], chain.tasks['p']}
+    chain.force(['m', 'n'])
+    assert chain.tasks['n'].is_forced
+
 
 def test_forcing_with_delete_data(tmp_path):
     config_data = {
@@ -305,6 +414,25 @@ def test_multi_chain(tmp_path):
     assert not mc['config2'].tasks['o'].is_forced
 
 
+def test_multi_chain_forces_shared_tasks_once(tmp_path):
+    class RunCountedTask(Task):
+        runs = 0
+
+        def run(self) -> int:
+            RunCountedTask.runs += 1
+            return RunCountedTask.runs
+
+    common_config = Config(tmp_path, name='common_config', data={'tasks': [RunCountedTask]})
+    config1 = Config(tmp_path, name='config1', data={'uses': [common_config]})
+    config2 = Config(tmp_path, name='config2', data={'uses': [common_config]})
+    mc = MultiChain([config1, config2])
+    assert mc['config1'].run_counted.value == 1
+
+    mc.force('run_counted', recompute=True)
+    assert RunCountedTask.runs == 2
+    assert mc['config2'].run_counted.value == 2
+
+
 class MyObject(ChainObject, ParameterObject):
     def __init__(self):
         self.x = None
@@ -325,6 +453,20 @@ def test_chain_objects(tmp_path):
     assert config['my_object'].x == 1
 
 
+def test_multi_chain_objects_in_used_config(tmp_path):
+    json.dump({'my_object': {'class': 'tests.test_chain.MyObject'}}, (tmp_path / 'common.json').open('w'))
+    for i in range(1, 3):
+        json.dump({'uses': f'{tmp_path}/common.json', 'x': i}, (tmp_path / f'config{i}.json').open('w'))
+
+    mc = MultiChain([Config(tmp_path, tmp_path / f'config{i}.json') for i in range(1, 3)])
+    objects = [
+        next(c['my_object'] for c in mc[f'config{i}']._configs.values() if 'my_object' in c) for i in range(1, 3)
+    ]
+    assert objects[0] is not objects[1]
+    assert objects[0].x == 1
+    assert objects[1].x == 2
+
+
 def test_task_short_names(tmp_path):
     class ABTask(Task):
         class Meta:
@@ -355,6 +497,20 @@ def test_task_short_names(tmp_path):
     _ = chain['b:b']
 
 
+def test_missing_parameter_error_names_config(tmp_path):
+    class RequiredParameterTask(Task):
+        class Meta:
+            parameters = [Parameter('required_value')]
+
+        def run(self) -> int:
+            return self.params.required_value
+
+    config = Config(tmp_path, name='cfg', data={'tasks': [RequiredParameterTask]})
+    for parameter_mode in (True, False):
+        with pytest.raises(ValueError, match='not found in config `cfg`$'):
+            Chain(config, parameter_mode=parameter_mode)
+
+
 def test_multiple_chain_instances(tmp_path):
     config_data = {
         'tasks': ['tests.tasks.a.*'],
@@ -98,6 +98,30 @@ class MyObject2(ParameterObject):
         return ''
 
 
+def test_file_data_are_not_shared(tmp_path):
+    path = tmp_path / 'config.json'
+    json.dump({'a': 1, 'c': {'d': 3}}, path.open('w'))
+
+    c1 = Config(tmp_path, path)
+    c2 = Config(tmp_path, path)
+    assert c1.data == c2.data
+    c1.data['c']['d'] = 4
+    assert c2.data['c']['d'] == 3
+
+    json.dump({'a': 1, 'c': {'d': 5}, 'e': 6}, path.open('w'))
+    assert Config(tmp_path, path).data['c']['d'] == 5
+
+
+def test_non_strict_json_file(tmp_path):
+    path = tmp_path / 'config.json'
+    path.write_text('{"a": NaN, "b": 123456789012345678901234567890, "c": Infinity}')
+
+    config = Config(tmp_path, path)
+    assert config.data['a'] != config.data['a']
+    assert config.data['b'] == 123456789012345678901234567890
+    assert config.data['c'] == float('inf')
+
+
 def test_config_objects(tmp_path):
     data = {
         'my_object': {
@@ -145,6 +169,10 @@ def test_namespace(tmp_path):
     assert c.name == 'test'
     assert c.fullname == 'ns::test'
 
+    # configs are plain objects, users can attach own attributes
+    c.note = 'x'
+    assert c.note == 'x'
+
 
 def test_context(tmp_path):
     json.dump({'b': 7}, (tmp_path / 'file_context.json').open('w'))
@@ -272,6 +300,18 @@ def test_context_for_namespaces_merging():
     assert context.a == 2
 
 
+def test_context_uses(tmp_path):
+    json.dump({'a': 3, 'for_namespaces': {'ns': {'x': 3}}}, (tmp_path / 'c3.json').open('w'))
+    json.dump({'uses': f'{tmp_path}/c3.json', 'a': 2, 'b': 2}, (tmp_path / 'c2.json').open('w'))
+    json.dump({'uses': f'{tmp_path}/c2.json', 'a': 1, 'b': 1, 'c': 1}, (tmp_path / 'c1.json').open('w'))
+
+    context = Context.prepare_context(tmp_path / 'c1.json')
+    assert context.name == 'c1;c2;c3'
+    assert (context.a, context.b, context.c) == (3, 2, 1)
+    assert context.for_namespaces['ns']['x'] == 3
+    assert 'uses' not in context
+
+
 def test_deepcopy(tmp_path):
     data = {
         'my_object': {
@@ -282,3 +322,22 @@ def test_deepcopy(tmp_path):
     }
     config = Config(tmp_path, data=data, name='config')
     assert deepcopy(config) == config
+
+    config = Config(tmp_path, data=data, name='config', context={'x': 1}, namespace='ns')
+    config_copy = deepcopy(config)
+    assert config_copy.fullname == config.fullname
+    assert config_copy.data.keys() == config.data.keys()
+    assert config_copy.my_object is not config.my_object
+    assert config_copy.my_object.a == config.my_object.a
+    assert config_copy.context is not config.context
+    assert config_copy.context.data == config.context.data
+
+    class MyConfig(Config):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.extra = {'a': 42}
+
+    config = MyConfig(tmp_path, data=data, name='config')
+    config_copy = deepcopy(config)
+    assert config_copy.extra == {'a': 42}
+    assert config_copy.extra is not config.extra
@@ -2,10 +2,20 @@ from collections.abc import Generator
 from pathlib import Path
 
 from taskchain import Task, Config, InMemoryData, JSONData
-from taskchain.data import DirData, NumpyData, PandasData, ContinuesData, GeneratedData
+from taskchain.data import (
+    DirData,
+    NumpyData,
+    ListOfNumpyData,
+    PandasData,
+    ParquetData,
+    ContinuesData,
+    GeneratedData,
+    FigureData,
+)
 
 import numpy as np
 import pandas as pd
+import pytest
 
 
 def test_persistence(tmp_path):
@@ -30,6 +40,7 @@ def test_persistence(tmp_path):
     assert a.run_called == 1
 
     assert (tmp_path / 'x' / 'a' / 'test.json').exists()
+    assert not (tmp_path / 'x' / 'a' / 'test.json.tmp').exists()
 
     a2 = A(config)
     assert a2.value == 1
@@ -188,6 +199,24 @@ def test_numpy_data(tmp_path):
     assert not (tmp_path / 'test.npy').exists()
 
 
+def test_list_of_numpy_data(tmp_path):
+    data = ListOfNumpyData()
+    data.init_persistence(tmp_path, 'test')
+    data.set_value([np.full(3, i) for i in range(12)])
+    data.save()
+
+    assert (tmp_path / 'test' / '11.npy').exists()
+    (tmp_path / 'test' / 'notes.txt').write_text('not an array')
+
+    data2 = ListOfNumpyData()
+    data2.init_persistence(tmp_path, 'test')
+    data2.load(list)
+
+    assert [v[0] for v in data2.value] == list(range(12))
+    data.delete()
+    assert not (tmp_path / 'test').exists()
+
+
 def test_pandas_data(tmp_path):
     data = PandasData()
     data.init_persistence(tmp_path, 'test')
@@ -197,6 +226,8 @@ def test_pandas_data(tmp_path):
     assert (tmp_path / 'test.pd').exists()
     assert data.is_data_type_accepted(pd.DataFrame)
     assert data.is_data_type_accepted(pd.Series)
+    assert not data.is_data_type_accepted(np.ndarray)
+    assert not NumpyData.is_data_type_accepted(pd.DataFrame)
 
     data2 = PandasData()
     data2.init_persistence(tmp_path, 'test')
@@ -207,6 +238,53 @@ def test_pandas_data(tmp_path):
     assert not (tmp_path / 'test.pd').exists()
 
 
+def test_parquet_data(tmp_path):
+    pytest.importorskip('pyarrow')
+
+    class A(Task):
+        class Meta:
+            task_group = 'x'
+
+        def run(self) -> ParquetData:
+            data = ParquetData()
+            data.set_value(pd.DataFrame({'a': [0, 1], 'b': ['x', 'y']}))
+            return data
+
+    config = Config(tmp_path, name='test')
+    assert A(config).value.shape == (2, 2)
+    assert (tmp_path / 'x' / 'a' / 'test.parquet').exists()
+
+    df = A(config).value
+    assert list(df.columns) == ['a', 'b']
+    assert df['b'].tolist() == ['x', 'y']
+
+    class B(Task):
+        def run(self) -> ParquetData:
+            data = ParquetData(compression=None)
+            data.set_value(pd.DataFrame({'a': [0, 1]}))
+            return data
+
+    assert B(config).value['a'].tolist() == [0, 1]
+    assert B(config).value['a'].tolist() == [0, 1]
+
+
+def test_figure_data(tmp_path):
+    from matplotlib import pyplot as plt
+    from matplotlib.figure import Figure
+
+    assert FigureData.is_data_type_accepted(Figure)
+    assert not FigureData.is_data_type_accepted(pd.DataFrame)
+
+    figure = plt.figure()
+    data = FigureData()
+    data.init_persistence(tmp_path, 'test')
+    data.set_value(figure)
+    data.save()
+
+    assert (tmp_path / 'test.pickle').exists()
+    assert (tmp_path / 'test.png').exists()
+
+
 def test_generator_data(tmp_path):
     data = GeneratedData()
     data.init_persistence(tmp_path, 'test')
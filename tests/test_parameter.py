@@ -29,6 +29,9 @@ def test_value():
     p.set_value(config)
     assert p.value == 'abc'
     assert p.required
+    # parameters are plain objects, users can attach own attributes
+    p.note = 'x'
+    assert p.note == 'x'
 
     p = Parameter('value3')
     with pytest.raises(ValueError):
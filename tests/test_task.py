@@ -7,7 +7,7 @@ import pytest
 from taskchain import Task, Config, ModuleTask
 from taskchain.data import JSONData, GeneratedData, InMemoryData
 from taskchain.parameter import Parameter, InputTaskParameter
-from taskchain.task import _find_task_full_name
+from taskchain.task import InputTasks, _find_task_full_name, _select_task_full_name, _task_name_aliases
 
 
 class ThisIsSomethingTask(Task):
@@ -455,6 +455,41 @@ def test_find_task_full_name():
     assert _find_task_full_name('n3::a', ['n3::n1::a', 'n3::a']) == 'n3::a'
 
 
+def test_task_name_aliases():
+    tasks = ['a', 'g:b', 'n1::a', 'n1::g:b', 'n2::n1::h:a', 'h:b']
+    for name in {alias for task in tasks for alias in _task_name_aliases(task)}:
+        matching_tasks = [task for task in tasks if name in _task_name_aliases(task)]
+        try:
+            expected = _find_task_full_name(name, tasks)
+        except KeyError:
+            with pytest.raises(KeyError):
+                _select_task_full_name(name, matching_tasks)
+        else:
+            assert _select_task_full_name(name, matching_tasks) == expected
+
+
+def test_input_tasks_lookup():
+    tasks = ['a', 'g:b', 'n1::a', 'n1::g:b', 'n1::g:a', 'n2::n1::h:a', 'h:b']
+    input_tasks = InputTasks()
+    for task in tasks:
+        input_tasks[task] = task.upper()
+
+    for name in {alias for task in tasks for alias in _task_name_aliases(task)} | set(tasks):
+        try:
+            expected = _find_task_full_name(name, tasks).upper()
+        except KeyError:
+            assert name not in input_tasks
+        else:
+            assert name in input_tasks
+            assert input_tasks[name] == expected
+    assert input_tasks[0] == 'A'
+    assert 'c' not in input_tasks
+    # full name is ambiguous when it is also short name of other task in the same namespace
+    assert 'n1::a' not in input_tasks
+    with pytest.raises(KeyError):
+        _ = input_tasks['n1::a']
+
+
 def test_in_memory_data(tmp_path):
     class A(Task):
         class Meta:
@@ -486,3 +521,31 @@ def test_in_memory_data(tmp_path):
     assert a.force(delete_data=True)
     assert a.value == 42
     assert a.run_called == 3
+
+
+def test_input_task_references():
+    class A(Task):
+        def run(self) -> int:
+            return 1
+
+    class B(Task):
+        class Meta:
+            input_tasks = [A, 'c']
+            parameters = [
+                Parameter('x', default=1),
+                InputTaskParameter('d', default=2),
+            ]
+
+        def run(self, a, c, d, x) -> int:
+            return a + c + d + x
+
+    class C(B):
+        class Meta:
+            input_tasks = [A]
+
+    references = B.input_task_references
+    assert [r.task for r in references] == [A, 'c', 'd']
+    assert [r.required for r in references] == [True, True, False]
+    assert references[2].default == 2
+    assert B.input_task_references is references
+    assert [r.task for r in C.input_task_references] == [A]
@@ -1,4 +1,6 @@
-from copy import deepcopy
+import importlib
+import sys
+from copy import copy, deepcopy
 from types import ModuleType
 
 import pytest
@@ -61,6 +63,30 @@ def test_import_by_string():
     assert T.__name__ == 'Task'
 
 
+def test_import_by_string_after_reload(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module_path = tmp_path / 'reloaded_module.py'
+    module_path.write_text('class A:\n    pass\n')
+    module = importlib.import_module('reloaded_module')
+    assert [m.__name__ for m in import_by_string('reloaded_module.*')] == ['A']
+
+    module_path.write_text('class A:\n    pass\n\n\nclass B:\n    pass\n')
+    importlib.reload(module)
+    assert [m.__name__ for m in import_by_string('reloaded_module.*')] == ['A', 'B']
+    assert import_by_string('reloaded_module.A') is module.A
+    del sys.modules['reloaded_module']
+
+
+def test_import_by_string_from_module_without_file(monkeypatch):
+    module = ModuleType('fileless_module')
+    monkeypatch.setitem(sys.modules, 'fileless_module', module)
+    exec('class A:\n    pass', module.__dict__)
+    assert [m.__name__ for m in import_by_string('fileless_module.*')] == ['A']
+
+    exec('class B:\n    pass', module.__dict__)
+    assert [m.__name__ for m in import_by_string('fileless_module.*')] == ['A', 'B']
+
+
 def test_traverse():
     assert len(list(traverse([]))) == 0
     assert len(list(traverse({}))) == 0
@@ -68,6 +94,7 @@ def test_traverse():
     assert len(list(traverse(['a', 'b']))) == 2
     assert len(list(traverse(['a', {1, 2, 3}]))) == 4
     assert len(list(traverse({1: 2, 3: [4, 5, 6, (1, 2, 3)]}))) == 7
+    assert list(traverse({1: 2, 3: [4, 5, 6, (1, 2, 3)]})) == [2, 4, 5, 6, 1, 2, 3]
 
 
 def test_search_and_apply():
@@ -166,6 +193,8 @@ def test_repr_str():
     assert repr(s) == "'b'"
     assert deepcopy(s) == s
     assert deepcopy(s) is not s
+    assert repr(deepcopy(s)) == "'b'"
+    assert repr(copy(s)) == "'b'"
 
 
 def test_search_and_replace_placeholders():